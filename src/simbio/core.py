@@ -6,7 +6,6 @@
 from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, Sequence
 
 import numpy as np
-import pandas as pd
 from numpy.typing import ArrayLike
 from poincare import Constant, Parameter, Variable
 from poincare._node import Node, NodeMapper, T, _ClassInfo
@@ -21,6 +20,7 @@
 
 if TYPE_CHECKING:
     import ipywidgets
+    import pandas as pd
 
 
 def initial(*, default: Initial | None = None, init: bool = True) -> Species:
@@ -34,14 +34,15 @@ def __init_subclass__(cls, **kwargs) -> None:
         super().__init_subclass__(**kwargs)
         signature: inspect.Signature = cls.__signature__
         parameters = dict(signature.parameters)
-        for k in cls._annotations.keys():
-            v = getattr(cls, k)
+        for k, p in signature.parameters.items():
+            # System.__init_subclass__ already stored getattr(cls, k) as default.
+            v = p.default
             if isinstance(v, Species):
                 default = v.variable.initial
                 if default is None:
                     cls._required.add(k)
                     default = inspect.Parameter.empty
-                parameters[k] = parameters[k].replace(default=default)
+                parameters[k] = p.replace(default=default)
         cls.__signature__ = signature.replace(parameters=parameters.values())
 
     @class_and_instance_method
@@ -204,8 +205,16 @@ def _yield_equations(self) -> Iterator[Equation]:
         for p in self.products:
             species_stoich[p.variable] += p.stoichiometry
 
+        rate_law = self.rate_law
         for s, st in species_stoich.items():
-            yield s.derive() << st * self.rate_law
+            if st == 0:
+                yield s.derive() << 0
+            elif st == 1:
+                yield s.derive() << rate_law
+            elif st == -1:
+                yield s.derive() << -rate_law
+            else:
+                yield s.derive() << st * rate_law
 
 
 class MassAction(RateLaw):
@@ -236,13 +245,16 @@ def __init__(
         self.reactants = tuple(map(Species.from_mul, reactants))
         self.products = tuple(map(Species.from_mul, products))
         self.rate = substitute(rate, _SpeciesToVariable)
+        self.rate_law = self._build_rate_law()
         self.equations = tuple(self._yield_equations())
 
-    @property
-    def rate_law(self):
+    def _build_rate_law(self):
         rate = self.rate
         for r in self.reactants:
-            rate *= r.variable**r.stoichiometry
+            if r.stoichiometry == 1:
+                rate *= r.variable
+            else:
+                rate *= r.variable**r.stoichiometry
         return rate
 
     def _copy_from(self, parent: System):
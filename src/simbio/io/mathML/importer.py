@@ -1,6 +1,5 @@
 import functools
 import keyword
-from collections import ChainMap
 
 import libsbml
 from libsbml import ASTNode
@@ -223,7 +222,7 @@ def impl(*args):
 
 class mathMLImporter:
     def __init__(self) -> None:
-        self.mapper = ChainMap({}, mapper)
+        self.mapper = dict(mapper)
 
     def convert(self, node: libsbml.ASTNode):
         func = self.mapper[node.getType()]
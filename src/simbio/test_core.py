@@ -129,9 +129,9 @@ class Model(Compartment):
 
     model: Model = f(Model)
     assert model.x.variable.equation_order == 1
-    assert set(model.eq1.equations) == {model.x.variable.derive() << -1 * model.c}
-    assert set(model.eq2.equations) == {model.x.variable.derive() << 1 * model.c}
-    assert set(model.eq3.equations) == {model.x.variable.derive() << 1 * model.c}
+    assert set(model.eq1.equations) == {model.x.variable.derive() << -model.c}
+    assert set(model.eq2.equations) == {model.x.variable.derive() << model.c}
+    assert set(model.eq3.equations) == {model.x.variable.derive() << model.c}
 
 
 @mark.parametrize("f", [non_instance, instance])
@@ -146,14 +146,27 @@ class Model(Compartment):
     model: Model = f(Model)
     assert model.x.variable.equation_order == 1
     assert set(model.eq1.equations) == {
-        model.x.variable.derive() << -1 * (model.c * (model.x.variable**1))
+        model.x.variable.derive() << -(model.c * model.x.variable)
     }
-    assert set(model.eq2.equations) == {model.x.variable.derive() << 1 * model.c}
+    assert set(model.eq2.equations) == {model.x.variable.derive() << model.c}
     assert set(model.eq3.equations) == {
-        model.x.variable.derive() << 1 * (model.c * (model.x.variable**2))
+        model.x.variable.derive() << model.c * (model.x.variable**2)
     }
 
 
+def test_catalyst():
+    class Model(Compartment):
+        x: Species = initial(default=1)
+        c: Constant = assign(default=1, constant=True)
+        eq = RateLaw(reactants=[x], products=[x], rate_law=c * x)
+
+    assert set(Model.eq.equations) == {Model.x.variable.derive() << 0}
+
+    times = np.linspace(0, 1, 10)
+    result = Simulator(Model).solve(save_at=times)
+    assert np.allclose(result["x"], 1)
+
+
 def test_duplicate_species():
     class Duplicate(Compartment):
         x: Species = initial(default=1)